@@ -5,9 +5,6 @@ A beautiful, interactive CLI for deploying Microsoft Fabric artifacts.
 """
 
 import os
-import sys
-from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
 import typer
@@ -15,24 +12,11 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.prompt import Confirm, Prompt
+from rich.prompt import Prompt
 from rich.table import Table
-from rich.text import Text
-from rich import print as rprint
-
-# Import our modules
-try:
-    from .fabric_deploy import FabricDeployer
-    from .fabric_validate import FabricValidator
-    from .fabric_preview import DeploymentPreview
-except ImportError:
-    # Fallback for standalone execution
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent))
-    from fabric_deploy import FabricDeployer
-    from fabric_validate import FabricValidator
-    from fabric_preview import DeploymentPreview
+
+# Deploy/validate/preview modules are imported inside the commands that use them
+# so --help and shell completion don't pay for YAML, jsonschema and the Azure SDK
 
 # Initialize Typer app with custom help
 app = typer.Typer(
@@ -46,6 +30,15 @@ app = typer.Typer(
 # Initialize Rich console
 console = Console()
 
+# Supported deployment environments, shared by option parsing and interactive prompts
+ENVIRONMENTS = {
+    "dev": "Development environment (safe for testing)",
+    "test": "Testing environment",
+    "staging": "Staging environment (pre-production)",
+    "prod": "Production environment (⚠️  use with caution)",
+}
+ENVIRONMENT_CHOICE = click.Choice(list(ENVIRONMENTS))
+
 # Add command aliases
 deploy_app = typer.Typer(help="Deploy Fabric artifacts to workspaces")
 validate_app = typer.Typer(help="Validate configurations and artifacts")
@@ -59,11 +52,15 @@ app.add_typer(workspace_app, name="workspace")
 # Helper functions
 def get_customer_names(incomplete: str):
     """Autocomplete customer names"""
-    config_dir = Path("configs/customers")
-    if config_dir.exists():
-        customers = [f.stem for f in config_dir.glob("*.yaml")]
-        return [c for c in customers if c.startswith(incomplete)]
-    return []
+    # A single directory read; a missing config directory just means no customers
+    try:
+        with os.scandir("configs/customers") as entries:
+            return [
+                entry.name[:-len(".yaml")] for entry in entries
+                if entry.name.endswith(".yaml") and entry.name.startswith(incomplete)
+            ]
+    except FileNotFoundError:
+        return []
 
 
 def run_interactive_deployment(customer: str, environment: str):
@@ -74,9 +71,9 @@ def run_interactive_deployment(customer: str, environment: str):
     if not customer:
         customers = get_customer_names("")
         if customers:
-            console.print("Available customers:")
-            for i, c in enumerate(customers, 1):
-                console.print(f"  {i}. {c}")
+            console.print("Available customers:\n" + "\n".join(
+                f"  {i}. {c}" for i, c in enumerate(customers, 1)
+            ))
             choice = Prompt.ask("Select customer", choices=[str(i) for i in range(1, len(customers)+1)])
             customer = customers[int(choice)-1]
         else:
@@ -86,15 +83,13 @@ def run_interactive_deployment(customer: str, environment: str):
     env_table = Table(title="Available Environments", show_header=False)
     env_table.add_column("Env", style="cyan")
     env_table.add_column("Description")
-    env_table.add_row("dev", "Development environment (safe for testing)")
-    env_table.add_row("test", "Testing environment")
-    env_table.add_row("staging", "Staging environment (pre-production)")
-    env_table.add_row("prod", "Production environment (⚠️  use with caution)")
+    for env, description in ENVIRONMENTS.items():
+        env_table.add_row(env, description)
     
     console.print(env_table)
     environment = Prompt.ask(
         "Select environment",
-        choices=["dev", "test", "staging", "prod"],
+        choices=list(ENVIRONMENTS),
         default=environment
     )
     
@@ -103,51 +98,56 @@ def run_interactive_deployment(customer: str, environment: str):
 
 def show_validation_results(success: bool, errors: list, warnings: list):
     """Display validation results in a beautiful format"""
+    # Collect every line first and render once instead of one write per line
+    lines = []
+    
     if warnings:
-        console.print("\n[yellow]⚠️  Warnings:[/yellow]")
+        lines.append("\n[yellow]⚠️  Warnings:[/yellow]")
         for warning in warnings:
-            console.print(f"   [yellow]•[/yellow] {warning}")
+            lines.append(f"   [yellow]•[/yellow] {warning}")
     
     if errors:
-        console.print("\n[red]❌ Errors:[/red]")
+        lines.append("\n[red]❌ Errors:[/red]")
         for error in errors:
-            console.print(f"   [red]•[/red] {error}")
+            lines.append(f"   [red]•[/red] {error}")
             # Show suggested fixes
             fix = suggest_fix_for_error(error)
             if fix:
-                console.print(f"     [dim]💡 Suggestion: {fix}[/dim]")
+                lines.append(f"     [dim]💡 Suggestion: {fix}[/dim]")
     
     # Summary
     summary_color = "green" if success else "red"
     summary_icon = "✅" if success else "❌"
-    console.print(f"\n[bold {summary_color}]{summary_icon} Validation {'passed' if success else 'failed'}[/bold {summary_color}]")
+    lines.append(f"\n[bold {summary_color}]{summary_icon} Validation {'passed' if success else 'failed'}[/bold {summary_color}]")
     
     if not success:
-        console.print(f"[dim]Found {len(errors)} error(s) and {len(warnings)} warning(s)[/dim]")
+        lines.append(f"[dim]Found {len(errors)} error(s) and {len(warnings)} warning(s)[/dim]")
+    
+    console.print("\n".join(lines))
+
+
+# Ordered (substrings that must all appear, suggestion) pairs; first match wins
+ERROR_FIXES = [
+    (("workspace", "not found"), "Verify the workspace ID exists in your Fabric tenant"),
+    (("workspace", "not assigned to any capacity"), "Assign the workspace to a Fabric capacity in Azure Portal"),
+    (("service principal lacks access",), "Grant the Service Principal contributor access to the workspace"),
+    (("notebook file not found",), "Check file path and ensure the file exists"),
+    (("pipeline file not found",), "Check file path and ensure the file exists"),
+    (("invalid resource name",), "Resource names must start/end with alphanumeric characters"),
+    (("duplicate",), "Use unique names for all resources"),
+    (("invalid prefix",), "Prefix must be 2-4 lowercase letters (e.g., 'ctso')"),
+    (("invalid capacity id format",), "Ensure capacity ID is a valid GUID format"),
+    (("schema validation failed",), "Check YAML syntax and required fields in configuration"),
+]
 
 
 def suggest_fix_for_error(error: str) -> Optional[str]:
     """Suggest fixes for common errors"""
     error_lower = error.lower()
     
-    if "workspace" in error_lower and "not found" in error_lower:
-        return "Verify the workspace ID exists in your Fabric tenant"
-    elif "workspace" in error_lower and "not assigned to any capacity" in error_lower:
-        return "Assign the workspace to a Fabric capacity in Azure Portal"
-    elif "service principal lacks access" in error_lower:
-        return "Grant the Service Principal contributor access to the workspace"
-    elif "notebook file not found" in error_lower or "pipeline file not found" in error_lower:
-        return "Check file path and ensure the file exists"
-    elif "invalid resource name" in error_lower:
-        return "Resource names must start/end with alphanumeric characters"
-    elif "duplicate" in error_lower:
-        return "Use unique names for all resources"
-    elif "invalid prefix" in error_lower:
-        return "Prefix must be 2-4 lowercase letters (e.g., 'ctso')"
-    elif "invalid capacity id format" in error_lower:
-        return "Ensure capacity ID is a valid GUID format"
-    elif "schema validation failed" in error_lower:
-        return "Check YAML syntax and required fields in configuration"
+    for needles, fix in ERROR_FIXES:
+        if all(needle in error_lower for needle in needles):
+            return fix
     
     return None
 
@@ -174,7 +174,7 @@ def deploy_run(
         "--env", "-e",
         help="Deployment environment",
         rich_help_panel="Deployment Options",
-        click_type=click.Choice(["dev", "test", "staging", "prod"])
+        click_type=ENVIRONMENT_CHOICE
     ),
     dry_run: bool = typer.Option(
         False,
@@ -199,6 +199,19 @@ def deploy_run(
         "--force", "-f",
         help="Force deployment even with warnings",
         rich_help_panel="Advanced Options"
+    ),
+    parallelism: Optional[int] = typer.Option(
+        None,
+        "--parallelism", "-p",
+        min=1, max=64,
+        help="Concurrent Terraform operations for plan/apply [default: 3x CPU cores, min 10, max 64]",
+        rich_help_panel="Advanced Options"
+    ),
+    force_init: bool = typer.Option(
+        False,
+        "--force-init",
+        help="Run terraform init even if the working directory looks initialized",
+        rich_help_panel="Advanced Options"
     )
 ):
     """
@@ -229,8 +242,15 @@ def deploy_run(
     if interactive:
         customer, environment = run_interactive_deployment(customer, environment)
     
+    try:
+        from .fabric_deploy import FabricDeployer
+    except ImportError:
+        # Fallback for standalone execution
+        from fabric_deploy import FabricDeployer
+    
     # Create deployer instance
-    deployer = FabricDeployer(customer, environment, console)
+    deployer = FabricDeployer(customer, environment, console,
+                              parallelism=parallelism, force_init=force_init)
     
     try:
         # Run deployment with beautiful progress
@@ -277,6 +297,12 @@ def deploy_preview(
         border_style="cyan"
     ))
     
+    try:
+        from .fabric_preview import DeploymentPreview
+    except ImportError:
+        # Fallback for standalone execution
+        from fabric_preview import DeploymentPreview
+    
     previewer = DeploymentPreview(customer, environment, console)
     previewer.show_preview(detailed=detailed)
 
@@ -285,7 +311,8 @@ def deploy_preview(
 def validate_all(
     customer: str = typer.Argument(..., help="Customer name"),
     environment: str = typer.Option("dev", "--env", "-e", help="Environment"),
-    fix: bool = typer.Option(False, "--fix", "-f", help="Attempt to fix issues automatically")
+    fix: bool = typer.Option(False, "--fix", "-f", help="Attempt to fix issues automatically"),
+    fail_fast: bool = typer.Option(False, "--fail-fast", "-x", help="Stop at the first failing check")
 ):
     """
     🔍 Run comprehensive validation checks
@@ -305,8 +332,14 @@ def validate_all(
         border_style="yellow"
     ))
     
+    try:
+        from .fabric_validate import FabricValidator
+    except ImportError:
+        # Fallback for standalone execution
+        from fabric_validate import FabricValidator
+    
     validator = FabricValidator(console=console)
-    success, errors, warnings = validator.validate_all(customer, environment)
+    success, errors, warnings = validator.validate_all(customer, environment, fail_fast=fail_fast)
     
     # Show results in a beautiful table
     show_validation_results(success, errors, warnings)
@@ -388,11 +421,13 @@ def init_project(
         progress.update(task, advance=1, description="Finalizing...")
     
     console.print(f"\n[bold green]✅ Project initialized for {customer}![/bold green]")
-    console.print("\nNext steps:")
-    console.print("  1. Edit [cyan]configs/customers/{}.yaml[/cyan]".format(customer))
-    console.print("  2. Add artifacts to [cyan]predefined-artifacts/{}/[/cyan]".format(customer))
-    console.print("  3. Run [green]fabric validate all {}[/green]".format(customer))
-    console.print("  4. Deploy with [green]fabric deploy run {} --env dev[/green]".format(customer))
+    console.print(
+        "\nNext steps:\n"
+        f"  1. Edit [cyan]configs/customers/{customer}.yaml[/cyan]\n"
+        f"  2. Add artifacts to [cyan]predefined-artifacts/{customer}/[/cyan]\n"
+        f"  3. Run [green]fabric validate all {customer}[/green]\n"
+        f"  4. Deploy with [green]fabric deploy run {customer} --env dev[/green]"
+    )
 
 
 @app.command("status")
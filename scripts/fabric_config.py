@@ -0,0 +1,45 @@
+"""
+Shared file loading helpers for the deploy, validate and preview commands
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C loader is several times faster than the pure-Python SafeLoader;
+# fall back to the latter when PyYAML was built without libyaml
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def file_size(path: Path) -> Optional[int]:
+    """Return the file size, or None if it is missing (one stat instead of exists + stat)"""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def json_loads(data):
+    """Parse JSON with orjson when available, else (or if orjson rejects it) with the json module"""
+    # orjson refuses NaN and Infinity, which json accepts and nbformat can write,
+    # so a document is only reported invalid if the json module rejects it too
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_yaml(path: Path):
+    """Parse a YAML file with the fastest available safe loader"""
+    # Hand libyaml raw bytes; it detects the encoding and decodes in C
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=YamlLoader)
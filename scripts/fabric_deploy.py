@@ -2,48 +2,70 @@
 Enhanced Fabric Deployer with Rich UI components
 """
 
+import hashlib
 import json
 import os
 import subprocess
+import tempfile
 import time
+from collections import deque
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import IO, Dict, Optional, Tuple
 
-import yaml
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.prompt import Confirm
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.tree import Tree
 
 try:
-    from .fabric_validate import FabricValidator
+    from .fabric_config import file_size, json_loads, load_yaml
 except ImportError:
     # Fallback for standalone execution
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent))
-    from fabric_validate import FabricValidator
+    from fabric_config import file_size, json_loads, load_yaml
+
+
+def default_terraform_parallelism() -> int:
+    """Terraform walks at most 10 resources at once by default; scale up with the host, never below that"""
+    return max(10, min(3 * (os.cpu_count() or 4), 64))
 
 
 class FabricDeployer:
     """Enhanced deployer with beautiful Rich UI"""
     
-    def __init__(self, customer_name: str, environment: str, console: Console):
+    def __init__(self, customer_name: str, environment: str, console: Console,
+                 parallelism: Optional[int] = None, force_init: bool = False):
         self.customer_name = customer_name
         self.environment = environment
         self.console = console
+        self.parallelism = parallelism or default_terraform_parallelism()
+        self.force_init = force_init
         self.project_root = Path(__file__).parent.parent
         self.terraform_dir = self.project_root / "terraform"
-        self.validator = FabricValidator(console=console)
+        self._validator = None
         self.deployment_steps = []
-        
+        self._init_process: Optional[subprocess.Popen] = None
+        self._init_log: Optional[IO[bytes]] = None
+        
+    @property
+    def validator(self):
+        """Validator, built on first use so dry-run previews never load jsonschema"""
+        if self._validator is None:
+            try:
+                from .fabric_validate import FabricValidator
+            except ImportError:
+                # Fallback for standalone execution
+                from fabric_validate import FabricValidator
+            # Same root as load_config, so the validated config is the one deployed
+            self._validator = FabricValidator(project_root=self.project_root, console=self.console)
+        return self._validator
+    
     def deploy(self, auto_approve: bool = False, force: bool = False) -> bool:
         """Main deployment with rich progress tracking"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Define deployment steps
         steps = [
@@ -54,6 +76,32 @@ class FabricDeployer:
             ("📊 Gathering results", self._gather_results_step)
         ]
         
+        # Terraform init only depends on the working directory, so start it now
+        # and let it overlap with validation and config loading. If an earlier
+        # step fails, the init is stopped rather than waited for.
+        try:
+            if self.force_init or self._needs_init():
+                try:
+                    self._start_terraform_init()
+                except OSError:
+                    # e.g. terraform not on PATH; the Terraform step retries
+                    # the init and reports the failure as a step error
+                    pass
+            success = self._run_deployment_steps(steps, auto_approve, force)
+        finally:
+            self._stop_terraform_init()
+        
+        if not success:
+            return False
+        
+        # Show deployment summary
+        duration = time.perf_counter() - start_time
+        self._show_deployment_summary(duration)
+        
+        return True
+    
+    def _run_deployment_steps(self, steps: list, auto_approve: bool, force: bool) -> bool:
+        """Run deployment steps with rich progress tracking"""
         # Create progress bar
         with Progress(
             SpinnerColumn(),
@@ -83,10 +131,6 @@ class FabricDeployer:
                     self._show_error(f"Error in {step_name}: {str(e)}")
                     return False
         
-        # Show deployment summary
-        duration = time.time() - start_time
-        self._show_deployment_summary(duration)
-        
         return True
     
     def preview_deployment(self) -> bool:
@@ -126,7 +170,8 @@ class FabricDeployer:
     
     def _load_config_step(self, **kwargs) -> dict:
         """Load configuration with progress"""
-        config = self.load_config()
+        # Validation already parsed this customer's config; only re-read it if it couldn't
+        config = self.validator.config or self.load_config()
         self.config = config
         return config
     
@@ -146,23 +191,36 @@ class FabricDeployer:
         """Run Terraform with live output"""
         auto_approve = kwargs.get('auto_approve', False)
         
-        os.chdir(self.terraform_dir)
-        
         # Check for secrets file
         secrets_file = self.terraform_dir / "secrets.tfvars"
         var_file_args = ["-var-file=secrets.tfvars"] if secrets_file.exists() else []
         
-        # Initialize Terraform
-        self.console.print("\n[dim]Initializing Terraform...[/dim]")
-        if not self._run_terraform_command(["terraform", "init"], show_output=False):
+        # Initialize Terraform (usually already running in the background)
+        if self._init_process is None and (self.force_init or self._needs_init()):
+            self._start_terraform_init()
+        if self._init_process is not None:
+            self.console.print("\n[dim]Initializing Terraform...[/dim]")
+            initialized = self._finish_terraform_init()
+        else:
+            self.console.print("\n[dim]Terraform already initialized, skipping init[/dim]")
+            initialized = True
+        if not initialized:
             return False
         
         # Plan
         self.console.print("[dim]Creating execution plan...[/dim]")
-        plan_cmd = ["terraform", "plan", "-out=tfplan"] + var_file_args
-        if not self._run_terraform_command(plan_cmd, show_output=False):
+        parallelism_arg = f"-parallelism={self.parallelism}"
+        # -detailed-exitcode: 0 means no changes, 2 means changes, 1 means an error
+        plan_cmd = ["terraform", "plan", "-detailed-exitcode", "-out=tfplan", parallelism_arg] + var_file_args
+        plan_exit = self._run_terraform_command(plan_cmd, show_output=False, success_codes=(0, 2))
+        if plan_exit not in (0, 2):
             return False
         
+        # A plan with nothing to do needs no confirmation or apply
+        if plan_exit == 0:
+            self.console.print("[green]No changes. Infrastructure is up to date.[/green]")
+            return True
+        
         # Show plan summary
         self._show_terraform_plan_summary()
         
@@ -174,26 +232,26 @@ class FabricDeployer:
         
         # Apply
         self.console.print("\n[dim]Applying changes...[/dim]")
-        apply_cmd = ["terraform", "apply", "tfplan"]
+        apply_cmd = ["terraform", "apply", parallelism_arg, "tfplan"]
         
         # Run apply with live output
         with Live(console=self.console, refresh_per_second=4) as live:
             process = subprocess.Popen(
                 apply_cmd,
+                cwd=self.terraform_dir,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
                 bufsize=1
             )
             
-            output_lines = []
+            # Only the last 10 lines are shown, so don't keep the whole apply log in memory
+            output_lines = deque(maxlen=10)
             for line in process.stdout:
                 output_lines.append(line.strip())
-                # Show last 10 lines
-                display_lines = output_lines[-10:]
                 live.update(
                     Panel(
-                        "\n".join(display_lines),
+                        "\n".join(output_lines),
                         title="[cyan]Terraform Apply Progress[/cyan]",
                         border_style="cyan"
                     )
@@ -208,12 +266,13 @@ class FabricDeployer:
         # Get Terraform outputs
         result = subprocess.run(
             ["terraform", "output", "-json"],
+            cwd=self.terraform_dir,
             capture_output=True,
             text=True
         )
         
         if result.returncode == 0:
-            self.outputs = json.loads(result.stdout)
+            self.outputs = json_loads(result.stdout)
         
         return True
     
@@ -222,20 +281,24 @@ class FabricDeployer:
         # Get plan details
         result = subprocess.run(
             ["terraform", "show", "-json", "tfplan"],
+            cwd=self.terraform_dir,
             capture_output=True,
             text=True
         )
         
         if result.returncode == 0:
-            plan = json.loads(result.stdout)
+            plan = json_loads(result.stdout)
             
-            # Count changes
-            to_add = len([c for c in plan.get('resource_changes', []) 
-                         if c['change']['actions'] == ['create']])
-            to_change = len([c for c in plan.get('resource_changes', []) 
-                           if c['change']['actions'] == ['update']])
-            to_delete = len([c for c in plan.get('resource_changes', []) 
-                           if c['change']['actions'] == ['delete']])
+            # Count changes in a single pass over the plan
+            to_add = to_change = to_delete = 0
+            for c in plan.get('resource_changes', []):
+                actions = c['change']['actions']
+                if actions == ['create']:
+                    to_add += 1
+                elif actions == ['update']:
+                    to_change += 1
+                elif actions == ['delete']:
+                    to_delete += 1
             
             # Create summary table
             table = Table(title="Terraform Plan Summary", show_header=False)
@@ -270,15 +333,17 @@ class FabricDeployer:
             lakehouses.add("🥇 Gold Lakehouse")
         
         # Notebooks
-        if config['artifacts'].get('notebooks'):
-            notebooks = tree.add(f"[green]Notebooks ({len(config['artifacts']['notebooks'])})[/green]")
-            for name, nb in config['artifacts']['notebooks'].items():
+        notebook_configs = config['artifacts'].get('notebooks')
+        if notebook_configs:
+            notebooks = tree.add(f"[green]Notebooks ({len(notebook_configs)})[/green]")
+            for nb in notebook_configs.values():
                 notebooks.add(f"📓 {nb['display_name']}")
         
         # Pipelines
-        if config['artifacts'].get('pipelines'):
-            pipelines = tree.add(f"[magenta]Pipelines ({len(config['artifacts']['pipelines'])})[/magenta]")
-            for name, pl in config['artifacts']['pipelines'].items():
+        pipeline_configs = config['artifacts'].get('pipelines')
+        if pipeline_configs:
+            pipelines = tree.add(f"[magenta]Pipelines ({len(pipeline_configs)})[/magenta]")
+            for pl in pipeline_configs.values():
                 pipelines.add(f"🔄 {pl['display_name']}")
         
         return tree
@@ -292,24 +357,18 @@ class FabricDeployer:
         table.add_column("Source Path")
         table.add_column("Size", justify="right")
         
-        # Add notebooks
-        for name, nb in config.get('artifacts', {}).get('notebooks', {}).items():
-            path = self.project_root / nb['path']
-            size = path.stat().st_size if path.exists() else 0
-            table.add_row(
-                "📓 Notebook",
-                nb['display_name'],
-                str(path.relative_to(self.project_root)),
-                f"{size:,} bytes"
-            )
-        
-        # Add pipelines
-        for name, pl in config.get('artifacts', {}).get('pipelines', {}).items():
-            path = self.project_root / pl['path']
-            size = path.stat().st_size if path.exists() else 0
+        # Notebooks, then pipelines, tagged with their type label
+        artifacts = config.get('artifacts', {})
+        tagged = chain(
+            (("📓 Notebook", nb) for nb in artifacts.get('notebooks', {}).values()),
+            (("🔄 Pipeline", pl) for pl in artifacts.get('pipelines', {}).values())
+        )
+        for kind, artifact in tagged:
+            path = self.project_root / artifact['path']
+            size = file_size(path) or 0
             table.add_row(
-                "🔄 Pipeline",
-                pl['display_name'],
+                kind,
+                artifact['display_name'],
                 str(path.relative_to(self.project_root)),
                 f"{size:,} bytes"
             )
@@ -353,46 +412,132 @@ class FabricDeployer:
             expand=False
         ))
     
-    def _run_terraform_command(self, cmd: list, show_output: bool = True) -> bool:
-        """Run a terraform command"""
-        result = subprocess.run(cmd, capture_output=True, text=True)
+    @property
+    def _init_stamp(self) -> Path:
+        """Records the fingerprint of the configuration the last successful init ran against"""
+        return self.terraform_dir / ".terraform" / "fabric-init.sha256"
+    
+    def _init_fingerprint(self) -> str:
+        """Hash of the dependency lock file and the root *.tf files, which decide what init installs"""
+        digest = hashlib.sha256()
+        lock_file = self.terraform_dir / ".terraform.lock.hcl"
+        for path in [lock_file, *sorted(self.terraform_dir.glob("*.tf"))]:
+            try:
+                content = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            digest.update(path.name.encode() + b"\0" + content + b"\0")
+        return digest.hexdigest()
+    
+    def _needs_init(self) -> bool:
+        """Whether terraform init must run: never run here, or the lock file or a .tf file changed since"""
+        try:
+            return self._init_stamp.read_text().strip() != self._init_fingerprint()
+        except OSError:
+            return True
+    
+    def _start_terraform_init(self):
+        """Start terraform init in the background, sharing downloaded providers through the plugin cache"""
+        env = os.environ.copy()
+        if "TF_PLUGIN_CACHE_DIR" not in env:
+            # The cache is only an optimization; skip it when HOME is missing or read-only
+            try:
+                plugin_cache = Path.home() / ".terraform.d" / "plugin-cache"
+                plugin_cache.mkdir(parents=True, exist_ok=True)
+                env["TF_PLUGIN_CACHE_DIR"] = str(plugin_cache)
+            except (OSError, RuntimeError):
+                pass
+        
+        # Output goes to a temp file rather than a pipe, so a chatty init can't
+        # block on a full buffer, and errors are held until the Terraform step
+        # reports them instead of landing in the middle of validation output
+        self._init_log = tempfile.TemporaryFile()
+        try:
+            self._init_process = subprocess.Popen(
+                ["terraform", "init", "-input=false"],
+                cwd=self.terraform_dir,
+                stdout=self._init_log,
+                stderr=subprocess.STDOUT,
+                env=env
+            )
+        except OSError:
+            self._init_log.close()
+            self._init_log = None
+            raise
+    
+    def _finish_terraform_init(self) -> bool:
+        """Wait for the background init and report its output if it failed"""
+        returncode = self._init_process.wait()
+        self._init_log.seek(0)
+        output = self._init_log.read().decode(errors="replace")
+        self._stop_terraform_init()
+        
+        if returncode != 0:
+            self.console.print(f"[red]Error: {output}[/red]")
+            return False
+        
+        # Fingerprint after init, which may have created or updated the lock file.
+        # Without a stamp the next deploy simply runs init again.
+        try:
+            self._init_stamp.write_text(self._init_fingerprint())
+        except OSError:
+            pass
+        return True
+    
+    def _stop_terraform_init(self):
+        """Terminate a background init that is no longer needed and release its log"""
+        if self._init_process is not None and self._init_process.poll() is None:
+            self._init_process.terminate()
+            try:
+                self._init_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._init_process.kill()
+                self._init_process.wait()
+        if self._init_log is not None:
+            self._init_log.close()
+        self._init_process = None
+        self._init_log = None
+    
+    def _run_terraform_command(self, cmd: list, show_output: bool = True,
+                               success_codes: Tuple[int, ...] = (0,)) -> int:
+        """Run a terraform command and return its exit code"""
+        result = subprocess.run(cmd, cwd=self.terraform_dir, capture_output=True, text=True)
         
         if show_output and result.stdout:
             self.console.print(result.stdout)
         
-        if result.returncode != 0:
-            if result.stderr:
-                self.console.print(f"[red]Error: {result.stderr}[/red]")
-            return False
+        if result.returncode not in success_codes and result.stderr:
+            self.console.print(f"[red]Error: {result.stderr}[/red]")
         
-        return True
+        return result.returncode
     
     def load_config(self) -> dict:
         """Load customer configuration"""
         config_path = self.project_root / "configs" / "customers" / f"{self.customer_name}.yaml"
         
-        if not config_path.exists():
-            raise FileNotFoundError(f"Customer config not found: {config_path}")
-        
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        try:
+            return load_yaml(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Customer config not found: {config_path}") from None
     
     def prepare_terraform_vars(self, config: dict) -> dict:
         """Prepare Terraform variables"""
-        env_config = config.get("environments", {}).get(self.environment, {})
-        
-        tf_vars = {
-            "customer_name": config["customer"]["name"],
-            "customer_prefix": config["customer"]["prefix"],
-            "workspace_id": config["infrastructure"]["workspace_id"],
-            "capacity_id": config["infrastructure"]["capacity_id"],
+        customer = config["customer"]
+        infrastructure = config["infrastructure"]
+        architecture = config["architecture"]
+        artifacts = config["artifacts"]
+
+        # Environment settings override the base values
+        return {
+            "customer_name": customer["name"],
+            "customer_prefix": customer["prefix"],
+            "workspace_id": infrastructure["workspace_id"],
+            "capacity_id": infrastructure["capacity_id"],
             "environment": self.environment,
-            "bronze_enabled": config["architecture"]["bronze_enabled"],
-            "silver_enabled": config["architecture"]["silver_enabled"],
-            "gold_enabled": config["architecture"]["gold_enabled"],
-            "notebooks": config["artifacts"].get("notebooks", {}),
-            "pipelines": config["artifacts"].get("pipelines", {})
-        }
-        
-        tf_vars.update(env_config)
-        return tf_vars
\ No newline at end of file
+            "bronze_enabled": architecture["bronze_enabled"],
+            "silver_enabled": architecture["silver_enabled"],
+            "gold_enabled": architecture["gold_enabled"],
+            "notebooks": artifacts.get("notebooks", {}),
+            "pipelines": artifacts.get("pipelines", {}),
+            **config.get("environments", {}).get(self.environment, {})
+        }
\ No newline at end of file
@@ -3,17 +3,20 @@ Deployment Preview module for showing what will be deployed
 """
 
 import json
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List
 
-import yaml
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.tree import Tree
-from rich.columns import Columns
-from rich.text import Text
+
+try:
+    from .fabric_config import file_size, load_yaml
+except ImportError:
+    # Fallback for standalone execution
+    from fabric_config import file_size, load_yaml
 
 
 class DeploymentPreview:
@@ -53,11 +56,10 @@ class DeploymentPreview:
         """Load customer configuration"""
         config_path = self.project_root / "configs" / "customers" / f"{self.customer_name}.yaml"
         
-        if not config_path.exists():
-            raise FileNotFoundError(f"Customer config not found: {config_path}")
-        
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        try:
+            return load_yaml(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Customer config not found: {config_path}") from None
     
     def _show_overview(self, config: dict):
         """Show deployment overview"""
@@ -133,27 +135,17 @@ class DeploymentPreview:
         table.add_column("Exists", justify="center")
         table.add_column("Size", justify="right")
         
-        # Add notebooks
-        for name, nb in config.get('artifacts', {}).get('notebooks', {}).items():
-            path = self.project_root / nb['path']
-            exists = "✅" if path.exists() else "❌"
-            size = f"{path.stat().st_size:,} B" if path.exists() else "N/A"
+        # Notebooks, then pipelines, in one pass
+        artifacts = config.get('artifacts', {})
+        for artifact in chain(artifacts.get('notebooks', {}).values(),
+                              artifacts.get('pipelines', {}).values()):
+            path = self.project_root / artifact['path']
+            size_bytes = file_size(path)
+            exists = "✅" if size_bytes is not None else "❌"
+            size = f"{size_bytes:,} B" if size_bytes is not None else "N/A"
             
             table.add_row(
-                nb['display_name'],
-                str(path.relative_to(self.project_root)),
-                exists,
-                size
-            )
-        
-        # Add pipelines
-        for name, pl in config.get('artifacts', {}).get('pipelines', {}).items():
-            path = self.project_root / pl['path']
-            exists = "✅" if path.exists() else "❌"
-            size = f"{path.stat().st_size:,} B" if path.exists() else "N/A"
-            
-            table.add_row(
-                pl['display_name'],
+                artifact['display_name'],
                 str(path.relative_to(self.project_root)),
                 exists,
                 size
@@ -163,6 +155,9 @@ class DeploymentPreview:
     
     def _show_detailed_artifacts(self, config: dict):
         """Show detailed artifact contents preview"""
+        # Syntax pulls in Pygments, so only load it for --detailed previews
+        from rich.syntax import Syntax
+        
         self.console.print(Panel.fit(
             "[bold]Detailed Artifact Preview[/bold]",
             border_style="yellow"
@@ -191,6 +186,8 @@ class DeploymentPreview:
     
     def _show_terraform_vars(self, config: dict):
         """Show Terraform variables that will be used"""
+        from rich.syntax import Syntax
+        
         env_config = config.get("environments", {}).get(self.environment, {})
         
         tf_vars = {
@@ -5,10 +5,10 @@ Maintains exact same validation logic as original
 
 import json
 import re
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import yaml
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -21,11 +21,13 @@ except ImportError:
     jsonschema = None
 
 try:
-    from azure.identity import ClientSecretCredential
-    import requests
+    from .fabric_config import json_loads, load_yaml
 except ImportError:
-    ClientSecretCredential = None
-    requests = None
+    # Fallback for standalone execution
+    from fabric_config import json_loads, load_yaml
+
+# Matches `name = "value"` assignments in .tfvars files
+TFVAR_PATTERN = re.compile(r'(\w+)\s*=\s*"([^"]+)"')
 
 
 class FabricValidator:
@@ -117,6 +119,9 @@ class FabricValidator:
         }
     }
     
+    # Compiled CONFIG_SCHEMA validator, built on first use and shared by all instances
+    _schema_validator = None
+    
     def __init__(self, project_root: Path = None, console: Console = None):
         self.project_root = project_root or Path.cwd()
         self.console = console or Console()
@@ -125,12 +130,20 @@ class FabricValidator:
         self._fabric_client = None
         self._workspace_name = None  # Store workspace name for later use
         self.validation_results = {}
+        self.check_errors: Dict[str, List[str]] = {}  # Errors raised by each check, in order
+        self.config: Optional[dict] = None  # Last parsed customer config, for reuse by callers
+        
+    def validate_all(self, customer_name: str, environment: str,
+                     fail_fast: bool = False) -> Tuple[bool, List[str], List[str]]:
+        """Run all validations with beautiful progress tracking
         
-    def validate_all(self, customer_name: str, environment: str) -> Tuple[bool, List[str], List[str]]:
-        """Run all validations with beautiful progress tracking"""
+        With fail_fast, checks after the first failing one are skipped.
+        """
         self.errors = []
         self.warnings = []
         self.validation_results = {}
+        self.check_errors = {}
+        self.config = None
         
         # Load config
         config_path = self.project_root / "configs" / "customers" / f"{customer_name}.yaml"
@@ -139,11 +152,11 @@ class FabricValidator:
             return False, self.errors, self.warnings
         
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
         except Exception as e:
             self.errors.append(f"Failed to parse YAML: {e}")
             return False, self.errors, self.warnings
+        self.config = config
         
         # Define validation checks
         checks = [
@@ -166,6 +179,13 @@ class FabricValidator:
             task = progress.add_task("[cyan]Running validation checks...", total=len(checks))
             
             for check_name, check_func in checks:
+                # Later checks (including the workspace API call) are wasted work
+                # once an earlier one has failed
+                if fail_fast and self.errors:
+                    self.validation_results[check_name] = "skipped"
+                    progress.advance(task)
+                    continue
+                
                 progress.update(task, description=f"[cyan]Checking {check_name}...")
                 
                 # Track errors before and after each check
@@ -182,6 +202,7 @@ class FabricValidator:
                     self.errors.append(f"{check_name}: {str(e)}")
                     self.validation_results[check_name] = "failed"
                 
+                self.check_errors[check_name] = self.errors[errors_before:]
                 progress.advance(task)
         
         # Display detailed results
@@ -206,29 +227,17 @@ class FabricValidator:
         table.add_column("Status", justify="center", width=10)
         table.add_column("Details", width=50)
         
-        # Track which errors belong to which check
-        error_mapping = {
-            "Configuration Schema": ["Schema validation failed"],
-            "Resource Naming": ["Invalid prefix", "Invalid resource name", "Resource name too"],
-            "Artifact Files": ["file not found", "Invalid notebook format", "Invalid pipeline format", "Invalid JSON"],
-            "Workspace Access": ["Workspace", "workspace"],
-            "Capacity Configuration": ["Invalid capacity", "Capacity"],
-            "Naming Conflicts": ["Duplicate resource name"]
-        }
-        
         for check_name, status in self.validation_results.items():
             if status == "passed":
                 status_icon = "[green]✅[/green]"
                 details = "[green]Passed[/green]"
+            elif status == "skipped":
+                status_icon = "[dim]⏭️[/dim]"
+                details = "[dim]Skipped after earlier failure[/dim]"
             else:
                 status_icon = "[red]❌[/red]"
-                # Find related errors for this specific check
-                related_errors = []
-                for error in self.errors:
-                    for keyword in error_mapping.get(check_name, []):
-                        if keyword in error:
-                            related_errors.append(error)
-                            break
+                # Errors were recorded per check while it ran
+                related_errors = self.check_errors.get(check_name)
                 
                 if related_errors:
                     # Show first error, truncate if too long
@@ -274,28 +283,43 @@ class FabricValidator:
         # Artifacts
         artifacts = tree.add("[magenta]Artifacts[/magenta]")
         
-        if config['artifacts'].get('notebooks'):
-            notebooks = artifacts.add(f"📓 Notebooks ({len(config['artifacts']['notebooks'])})")
-            for name, nb in list(config['artifacts']['notebooks'].items())[:3]:
+        # Only the first three of each are listed; islice avoids copying the rest
+        notebook_configs = config['artifacts'].get('notebooks')
+        if notebook_configs:
+            notebooks = artifacts.add(f"📓 Notebooks ({len(notebook_configs)})")
+            for nb in islice(notebook_configs.values(), 3):
                 notebooks.add(nb['display_name'])
-            if len(config['artifacts']['notebooks']) > 3:
+            if len(notebook_configs) > 3:
                 notebooks.add("...")
         
-        if config['artifacts'].get('pipelines'):
-            pipelines = artifacts.add(f"🔄 Pipelines ({len(config['artifacts']['pipelines'])})")
-            for name, pl in list(config['artifacts']['pipelines'].items())[:3]:
+        pipeline_configs = config['artifacts'].get('pipelines')
+        if pipeline_configs:
+            pipelines = artifacts.add(f"🔄 Pipelines ({len(pipeline_configs)})")
+            for pl in islice(pipeline_configs.values(), 3):
                 pipelines.add(pl['display_name'])
-            if len(config['artifacts']['pipelines']) > 3:
+            if len(pipeline_configs) > 3:
                 pipelines.add("...")
         
         self.console.print(tree)
     
     def _validate_yaml_schema(self, config: dict) -> None:
         """Validate config against JSON schema - EXACT SAME LOGIC AS ORIGINAL"""
-        try:
-            jsonschema.validate(config, self.CONFIG_SCHEMA)
-        except jsonschema.ValidationError as e:
-            self.errors.append(f"Schema validation failed: {e.message}")
+        # Same result as jsonschema.validate, without re-checking and rebuilding the
+        # validator on every call
+        error = jsonschema.exceptions.best_match(
+            self._get_schema_validator().iter_errors(config)
+        )
+        if error is not None:
+            self.errors.append(f"Schema validation failed: {error.message}")
+    
+    @classmethod
+    def _get_schema_validator(cls):
+        """Check and compile CONFIG_SCHEMA once per process"""
+        if cls._schema_validator is None:
+            validator_cls = jsonschema.validators.validator_for(cls.CONFIG_SCHEMA)
+            validator_cls.check_schema(cls.CONFIG_SCHEMA)
+            cls._schema_validator = validator_cls(cls.CONFIG_SCHEMA)
+        return cls._schema_validator
             
     def _validate_resource_names(self, config: dict) -> None:
         """Validate all resource names - EXACT SAME LOGIC AS ORIGINAL"""
@@ -306,13 +330,7 @@ class FabricValidator:
             self.errors.append(f"Invalid prefix '{prefix}': must be 2-4 lowercase letters")
         
         # Check all display names
-        all_names = []
-        
-        # Collect artifact names
-        for notebook in config.get('artifacts', {}).get('notebooks', {}).values():
-            all_names.append(notebook['display_name'])
-        for pipeline in config.get('artifacts', {}).get('pipelines', {}).values():
-            all_names.append(pipeline['display_name'])
+        all_names = self._collect_display_names(config)
             
         # Add generated lakehouse names
         if config['architecture']['bronze_enabled']:
@@ -339,35 +357,34 @@ class FabricValidator:
             
     def _validate_artifact_files(self, config: dict) -> None:
         """Validate artifact files exist and are valid - EXACT SAME LOGIC AS ORIGINAL"""
+        artifacts = config.get('artifacts', {})
+        
         # Check notebooks
-        for name, notebook in config.get('artifacts', {}).get('notebooks', {}).items():
-            path = self.project_root / notebook['path']
-            if not path.exists():
-                self.errors.append(f"Notebook file not found: {path}")
-            else:
-                # Validate it's a valid notebook
-                try:
-                    with open(path, 'r') as f:
-                        content = json.load(f)
-                        if 'cells' not in content:
-                            self.errors.append(f"Invalid notebook format (missing 'cells'): {path}")
-                except json.JSONDecodeError:
-                    self.errors.append(f"Invalid JSON in notebook: {path}")
+        for name, notebook in artifacts.get('notebooks', {}).items():
+            error = self._check_artifact_file(self.project_root / notebook['path'], "notebook", 'cells')
+            if error:
+                self.errors.append(error)
                     
         # Check pipelines
-        for name, pipeline in config.get('artifacts', {}).get('pipelines', {}).items():
-            path = self.project_root / pipeline['path']
-            if not path.exists():
-                self.errors.append(f"Pipeline file not found: {path}")
-            else:
-                # Validate it's valid JSON
-                try:
-                    with open(path, 'r') as f:
-                        content = json.load(f)
-                        if 'properties' not in content:
-                            self.errors.append(f"Invalid pipeline format (missing 'properties'): {path}")
-                except json.JSONDecodeError:
-                    self.errors.append(f"Invalid JSON in pipeline: {path}")
+        for name, pipeline in artifacts.get('pipelines', {}).items():
+            error = self._check_artifact_file(self.project_root / pipeline['path'], "pipeline", 'properties')
+            if error:
+                self.errors.append(error)
+    
+    def _check_artifact_file(self, path: Path, kind: str, required_key: str) -> Optional[str]:
+        """Return an error message if the artifact is missing, not JSON, or lacks its key"""
+        # Open directly instead of probing with exists() first: one syscall fewer per file
+        try:
+            with open(path, 'rb') as f:
+                content = json_loads(f.read())
+        except FileNotFoundError:
+            return f"{kind.capitalize()} file not found: {path}"
+        except json.JSONDecodeError:
+            return f"Invalid JSON in {kind}: {path}"
+        
+        if required_key not in content:
+            return f"Invalid {kind} format (missing '{required_key}'): {path}"
+        return None
     
     def _validate_workspace_access(self, config: dict) -> None:
         """Check if workspace exists and is accessible - EXACT SAME LOGIC AS ORIGINAL"""
@@ -375,8 +392,12 @@ class FabricValidator:
         
         # Try to load Service Principal credentials
         try:
-            # Check if Azure SDK is available
-            if ClientSecretCredential is None:
+            # Check if Azure SDK is available. It is imported here rather than at
+            # module load because this is the only check that needs it.
+            try:
+                from azure.identity import ClientSecretCredential
+                import requests
+            except ImportError:
                 self.warnings.append("Azure SDK not installed - skipping workspace access validation")
                 return
                 
@@ -387,12 +408,11 @@ class FabricValidator:
                 
             # Parse secrets file
             with open(secrets_path, 'r') as f:
-                content = f.read()
+                tfvars = self._parse_tfvars(f.read())
                 
-            # Extract values (simple parsing for .tfvars format)
-            tenant_id = self._extract_tfvar(content, 'tenant_id')
-            client_id = self._extract_tfvar(content, 'client_id')
-            client_secret = self._extract_tfvar(content, 'client_secret')
+            tenant_id = tfvars.get('tenant_id')
+            client_id = tfvars.get('client_id')
+            client_secret = tfvars.get('client_secret')
             
             if not all([tenant_id, client_id, client_secret]):
                 self.warnings.append("Could not parse Service Principal credentials from secrets.tfvars")
@@ -451,13 +471,11 @@ class FabricValidator:
     
     def _check_naming_conflicts(self, config: dict) -> None:
         """Check for duplicate resource names - EXACT SAME LOGIC AS ORIGINAL"""
-        all_names = []
+        all_names = self._collect_display_names(config)
         
-        # Collect all display names
-        for notebook in config.get('artifacts', {}).get('notebooks', {}).values():
-            all_names.append(notebook['display_name'])
-        for pipeline in config.get('artifacts', {}).get('pipelines', {}).values():
-            all_names.append(pipeline['display_name'])
+        # Fast path: nothing to report when every name is unique
+        if len(set(all_names)) == len(all_names):
+            return
             
         # Check for duplicates
         seen = set()
@@ -471,8 +489,17 @@ class FabricValidator:
             for dup in duplicates:
                 self.errors.append(f"Duplicate resource name: '{dup}'")
     
-    def _extract_tfvar(self, content: str, var_name: str) -> Optional[str]:
-        """Extract variable value from tfvars content - EXACT SAME LOGIC AS ORIGINAL"""
-        pattern = rf'{var_name}\s*=\s*"([^"]+)"'
-        match = re.search(pattern, content)
-        return match.group(1) if match else None
\ No newline at end of file
+    def _collect_display_names(self, config: dict) -> List[str]:
+        """Collect notebook and pipeline display names in config order"""
+        artifacts = config.get('artifacts', {})
+        names = [nb['display_name'] for nb in artifacts.get('notebooks', {}).values()]
+        names.extend(pl['display_name'] for pl in artifacts.get('pipelines', {}).values())
+        return names
+    
+    def _parse_tfvars(self, content: str) -> Dict[str, str]:
+        """Extract all string variables from tfvars content in a single scan"""
+        values: Dict[str, str] = {}
+        for name, value in TFVAR_PATTERN.findall(content):
+            # Keep the first assignment, as a per-variable search would
+            values.setdefault(name, value)
+        return values
\ No newline at end of file